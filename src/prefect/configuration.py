@@ -13,6 +13,15 @@ DEFAULT_CONFIG = os.path.join(os.path.dirname(__file__), "config.toml")
 USER_CONFIG = os.getenv("PREFECT__USER_CONFIG_PATH", "~/.prefect/config.toml")
 ENV_VAR_PREFIX = "PREFECT"
 INTERPOLATION_REGEX = re.compile(r"\${(.[^${}]*)}")
+BOOLEAN_STRINGS = {"TRUE": True, "FALSE": False}
+# matches any string that `string_to_type` might convert; ints and floats must also
+# round-trip through `str` to be converted
+TYPED_VALUE_REGEX = re.compile(
+    r"(?P<bool>true|false)"
+    r"|(?P<int>-?\d+)"
+    r"|(?P<float>-?(\d+\.\d+|\d(\.\d+)?e[+-]\d+|inf)|nan)",
+    re.IGNORECASE,
+)
 
 
 class Config(collections.DotDict):
@@ -141,27 +150,31 @@ def string_to_type(val: str) -> Union[bool, int, float, str]:
         Union[bool, int, float, str]: the type-cast env var value
     """
 
+    # only strings that look like a bool, int or float need to be converted; everything
+    # else is rejected by a single regex match instead of failed conversion attempts
+    match = TYPED_VALUE_REGEX.fullmatch(val)
+    if match is None:
+        return val
+
     # bool
-    if val.upper() == "TRUE":
-        return True
-    elif val.upper() == "FALSE":
-        return False
+    if match.lastgroup == "bool":
+        return BOOLEAN_STRINGS[val.upper()]
 
     # int
-    try:
-        val_as_int = int(val)
+    elif match.lastgroup == "int":
+        # very long digit strings exceed Python's int string conversion limit
+        try:
+            val_as_int = int(val)
+        except ValueError:
+            return val
         if str(val_as_int) == val:
             return val_as_int
-    except Exception:
-        pass
 
     # float
-    try:
+    else:
         val_as_float = float(val)
         if str(val_as_float) == val:
             return val_as_float
-    except Exception:
-        pass
 
     # return string value
     return val
@@ -295,11 +308,13 @@ def interpolate_config(config: dict, env_var_prefix: str = None) -> Config:
 
     if env_var_prefix:
 
+        env_var_prefix = env_var_prefix + "__"
+
         for env_var, env_var_value in os.environ.items():
-            if env_var.startswith(env_var_prefix + "__"):
+            if env_var.startswith(env_var_prefix):
 
                 # strip the prefix off the env var
-                env_var_option = env_var[len(env_var_prefix + "__") :]
+                env_var_option = env_var[len(env_var_prefix) :]
 
                 # make sure the resulting env var has at least one delimitied section and key
                 if "__" not in env_var:
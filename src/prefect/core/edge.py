@@ -3,6 +3,7 @@ from typing import Set
 
 import prefect
 from prefect.core.task import Task
+from prefect.utilities.serialization import get_dump_schema
 
 
 def is_valid_identifier(string: str) -> bool:
@@ -126,4 +127,4 @@ class Edge:
         """
         Represents the Edge as a dict.
         """
-        return prefect.serialization.edge.EdgeSchema().dump(self)
+        return get_dump_schema(prefect.serialization.edge.EdgeSchema).dump(self)
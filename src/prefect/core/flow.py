@@ -29,7 +29,7 @@ from mypy_extensions import TypedDict
 import prefect
 import prefect.schedules
 from prefect.core.edge import Edge
-from prefect.core.task import Parameter, Task
+from prefect.core.task import Parameter, Task, _get_run_signature
 from prefect.engine.result import NoResult
 from prefect.engine.result_handlers import ResultHandler
 from prefect.environments import RemoteEnvironment, Environment
@@ -494,7 +494,7 @@ class Flow:
             edge_keys = {
                 e.key: None for e in self.edges_to(downstream_task) if e.key is not None
             }
-            inspect.signature(downstream_task.run).bind_partial(**edge_keys)
+            _get_run_signature(downstream_task.run).bind_partial(**edge_keys)
 
         self._cache.clear()
 
@@ -1,17 +1,33 @@
 import collections
 import copy
 import inspect
+import types
 import uuid
 import warnings
+import weakref
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import prefect
-import prefect.engine.cache_validators
 import prefect.engine.signals
 import prefect.triggers
+from prefect.engine.cache_validators import duration_only, never_use
 from prefect.utilities import logging
 from prefect.utilities.notifications import callback_factory
+from prefect.utilities.serialization import get_dump_schema
 
 if TYPE_CHECKING:
     from prefect.core.flow import Flow  # pylint: disable=W0611
@@ -20,6 +36,214 @@ if TYPE_CHECKING:
 
 VAR_KEYWORD = inspect.Parameter.VAR_KEYWORD
 
+# information derived from `run` methods, keyed by their underlying function so that
+# entries are shared by every instance of a Task class and released along with it
+_RUN_SIGNATURES = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+_RUN_INPUTS = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+_RUN_VAR_KEYWORDS = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+_RUN_BINDERS = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+
+# shared, read-only stand-in for missing parameters
+_NO_PARAMETERS = types.MappingProxyType({})  # type: Mapping[str, Any]
+
+# every distinct set of tags that has been assigned to a Task
+_TAG_SETS = {}  # type: Dict[FrozenSet[str], FrozenSet[str]]
+
+
+def _intern_tags(tags: Iterable[str]) -> FrozenSet[str]:
+    """
+    Returns an immutable set of the provided tags. Tag sets are interned, so the many
+    Tasks that share the same tags (typically inherited from a `prefect.tags` context)
+    also share a single set object.
+
+    Args:
+        - tags (Iterable[str]): the tags
+
+    Returns:
+        - FrozenSet[str]: the canonical set containing these tags
+    """
+    tags = frozenset(tags)
+    return _TAG_SETS.setdefault(tags, tags)
+
+
+# the tags of every untagged Task
+_NO_TAGS = _intern_tags(())
+
+
+def _cached_for_run(
+    cache: weakref.WeakKeyDictionary, run: Callable, compute: Callable[[Callable], Any]
+) -> Any:
+    func = getattr(run, "__func__", run)
+    is_method = func is not run
+    try:
+        return cache[func][is_method]
+    except (KeyError, TypeError):
+        value = compute(run)
+
+    # callables that can't be weakly referenced are simply not cached
+    try:
+        cache.setdefault(func, {})[is_method] = value
+    except TypeError:
+        pass
+    return value
+
+
+def _get_run_signature(run: Callable) -> inspect.Signature:
+    """
+    Returns the signature of a Task's `run` method. Building a signature is expensive and
+    happens every time a Task is bound, so signatures are cached on the function that
+    underlies `run` (for bound methods, the function defined on the class).
+
+    Args:
+        - run (Callable): a Task's `run` method, or any callable assigned to it
+
+    Returns:
+        - inspect.Signature: the signature of `run`
+    """
+    return _cached_for_run(_RUN_SIGNATURES, run, inspect.signature)
+
+
+def _find_var_keyword(run: Callable) -> Optional[str]:
+    return next(
+        (
+            name
+            for name, p in _get_run_signature(run).parameters.items()
+            if p.kind == VAR_KEYWORD
+        ),
+        None,
+    )
+
+
+def _get_run_var_keyword(run: Callable) -> Optional[str]:
+    """
+    Returns the name of the `**kwargs` argument of a Task's `run` method, if it has one,
+    cached in the same manner as `_get_run_signature`.
+
+    Args:
+        - run (Callable): a Task's `run` method, or any callable assigned to it
+
+    Returns:
+        - str: the name of the variable keyword argument, or `None`
+    """
+    return _cached_for_run(_RUN_VAR_KEYWORDS, run, _find_var_keyword)
+
+
+def _build_generic_binder(run: Callable) -> Callable[..., Dict[str, Any]]:
+    signature = _get_run_signature(run)
+    var_kw_arg = _get_run_var_keyword(run)
+
+    def bind(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        callargs = dict(signature.bind(*args, **kwargs).arguments)
+
+        # bind() compresses all variable keyword arguments under the ** argument name,
+        # so we expand them explicitly
+        if var_kw_arg:
+            callargs.update(callargs.pop(var_kw_arg, {}))
+        return callargs
+
+    return bind
+
+
+def _build_binder(run: Callable) -> Callable[..., Dict[str, Any]]:
+    """
+    Compiles a function with the same arguments as `run` which returns a dictionary of
+    the arguments it was explicitly passed, with any `**kwargs` expanded into it. This is
+    equivalent to (but much faster than) `inspect.Signature.bind`. Signatures that can't
+    be expressed this way fall back to `inspect.Signature.bind`.
+    """
+    parameters = list(_get_run_signature(run).parameters.values())
+    names = {p.name for p in parameters}
+
+    # pick local names that can't collide with any argument name
+    missing, callargs = "_missing", "_callargs"
+    while missing in names or callargs in names:
+        missing, callargs = missing + "_", callargs + "_"
+
+    args = []  # type: List[str]
+    body = []  # type: List[str]
+    for p in parameters:
+        if p.kind == VAR_KEYWORD:
+            args.append("**" + p.name)
+            body.append("{}.update({})".format(callargs, p.name))
+            continue
+        elif p.kind == inspect.Parameter.KEYWORD_ONLY:
+            if "*" not in args:
+                args.append("*")
+        elif p.kind != inspect.Parameter.POSITIONAL_OR_KEYWORD:
+            # positional-only and variable positional arguments
+            return _build_generic_binder(run)
+
+        assignment = "{}[{!r}] = {}".format(callargs, p.name, p.name)
+        if p.default is p.empty:
+            args.append(p.name)
+            body.append(assignment)
+        else:
+            # only explicitly provided arguments are bound, so defaults are skipped
+            args.append("{}={}".format(p.name, missing))
+            body.append("if {} is not {}:".format(p.name, missing))
+            body.append("    " + assignment)
+
+    source = "def run({}):\n    {} = {{}}\n{}    return {}\n".format(
+        ", ".join(args),
+        callargs,
+        "".join("    " + line + "\n" for line in body),
+        callargs,
+    )
+    namespace = {missing: object()}  # type: Dict[str, Any]
+    try:
+        exec(compile(source, "<prefect.core.task binder>", "exec"), namespace)
+    except SyntaxError:
+        # for example, too many arguments for older versions of Python
+        return _build_generic_binder(run)
+    return namespace["run"]
+
+
+def _get_run_binder(run: Callable) -> Callable[..., Dict[str, Any]]:
+    """
+    Returns a function that binds arguments to a Task's `run` method, cached in the
+    same manner as `_get_run_signature`. Calling the binder returns a dictionary of the
+    explicitly provided arguments (defaults are not included) and raises a `TypeError`
+    if the arguments are not valid for `run`.
+
+    Args:
+        - run (Callable): a Task's `run` method, or any callable assigned to it
+
+    Returns:
+        - Callable: a function accepting the same arguments as `run`
+    """
+    return _cached_for_run(_RUN_BINDERS, run, _build_binder)
+
+
+def _describe_inputs(run: Callable) -> Tuple[Tuple[str, Any, Any, bool], ...]:
+    inputs = []  # type: List[Tuple[str, Any, Any, bool]]
+    for name, parameter in _get_run_signature(run).parameters.items():
+        input_type = parameter.annotation
+        if input_type is inspect._empty:  # type: ignore
+            input_type = Any
+
+        input_default = parameter.default
+        input_required = False
+        if input_default is inspect._empty:  # type: ignore
+            input_required = True
+            input_default = None
+
+        inputs.append((name, input_type, input_default, input_required))
+    return tuple(inputs)
+
+
+def _get_run_inputs(run: Callable) -> Tuple[Tuple[str, Any, Any, bool], ...]:
+    """
+    Returns a `(name, type, default, required)` tuple for each argument of a Task's `run`
+    method, cached in the same manner as `_get_run_signature`.
+
+    Args:
+        - run (Callable): a Task's `run` method, or any callable assigned to it
+
+    Returns:
+        - tuple: a description of each input to `run`
+    """
+    return _cached_for_run(_RUN_INPUTS, run, _describe_inputs)
+
 
 def _validate_run_signature(run: Callable) -> None:
     func = getattr(run, "__wrapped__", run)
@@ -166,8 +390,11 @@ class Task(metaclass=SignatureValidator):
         # avoid silently iterating over a string
         if isinstance(tags, str):
             raise TypeError("Tags should be a set of tags, not a string.")
-        current_tags = set(prefect.context.get("tags", set()))
-        self.tags = (set(tags) if tags is not None else set()) | current_tags
+        context_tags = prefect.context.get("tags", ())
+        if tags or context_tags:
+            self.tags = _intern_tags(set(tags or ()).union(context_tags))
+        else:
+            self.tags = _NO_TAGS
 
         max_retries = (
             max_retries
@@ -199,8 +426,7 @@ class Task(metaclass=SignatureValidator):
         self.skip_on_upstream_skip = skip_on_upstream_skip
 
         if cache_for is None and (
-            cache_validator is not None
-            and cache_validator is not prefect.engine.cache_validators.never_use
+            cache_validator is not None and cache_validator is not never_use
         ):
             warnings.warn(
                 "cache_validator provided without specifying cache expiration (cache_for); this Task will not be cached."
@@ -208,11 +434,7 @@ class Task(metaclass=SignatureValidator):
 
         self.cache_for = cache_for
         self.cache_key = cache_key
-        default_validator = (
-            prefect.engine.cache_validators.never_use
-            if cache_for is None
-            else prefect.engine.cache_validators.duration_only
-        )
+        default_validator = never_use if cache_for is None else duration_only
         self.cache_validator = cache_validator or default_validator
         self.checkpoint = (
             checkpoint
@@ -231,7 +453,7 @@ class Task(metaclass=SignatureValidator):
         self.auto_generated = False
 
     def __repr__(self) -> str:
-        return "<Task: {self.name}>".format(self=self)
+        return "<Task: {}>".format(self.name)
 
     # reimplement __hash__ because we override __eq__
     def __hash__(self) -> int:
@@ -310,9 +532,9 @@ class Task(metaclass=SignatureValidator):
             else:
                 setattr(new, attr, val)
 
-        new.tags = copy.deepcopy(self.tags).union(set(new.tags))
-        tags = set(prefect.context.get("tags", set()))
-        new.tags.update(tags)
+        new.tags = _intern_tags(
+            self.tags.union(new.tags, prefect.context.get("tags", ()))
+        )
 
         return new
 
@@ -388,17 +610,13 @@ class Task(metaclass=SignatureValidator):
             - Task: the current Task instance
         """
 
-        # this will raise an error if callargs weren't all provided
-        signature = inspect.signature(self.run)
-        callargs = dict(signature.bind(*args, **kwargs).arguments)  # type: Dict
-
-        # bind() compresses all variable keyword arguments under the ** argument name,
-        # so we expand them explicitly
-        var_kw_arg = next(
-            (p for p in signature.parameters.values() if p.kind == VAR_KEYWORD), None
-        )
-        if var_kw_arg:
-            callargs.update(callargs.pop(var_kw_arg.name, {}))
+        run = self.run
+        if not (args or kwargs) and getattr(run, "__func__", None) is Task.run:
+            # the default run() accepts no arguments, so there is nothing to bind
+            callargs = {}  # type: Dict
+        else:
+            # this will raise an error if callargs weren't all provided
+            callargs = _get_run_binder(run)(*args, **kwargs)
 
         flow = flow or prefect.context.get("flow", None)
         if not flow:
@@ -411,8 +629,9 @@ class Task(metaclass=SignatureValidator):
             mapped=mapped,
         )
 
-        tags = set(prefect.context.get("tags", set()))
-        self.tags.update(tags)
+        tags = prefect.context.get("tags")
+        if tags:
+            self.tags = _intern_tags(self.tags.union(tags))
 
         return self
 
@@ -553,23 +772,12 @@ class Task(metaclass=SignatureValidator):
         Returns:
             - dict
         """
-        inputs = {}
-        for name, parameter in inspect.signature(self.run).parameters.items():
-            input_type = parameter.annotation
-            if input_type is inspect._empty:  # type: ignore
-                input_type = Any
-
-            input_default = parameter.default
-            input_required = False
-            if input_default is inspect._empty:  # type: ignore
-                input_required = True
-                input_default = None
-
-            inputs[name] = dict(
-                type=input_type, default=input_default, required=input_required
+        return {
+            name: dict(type=input_type, default=input_default, required=input_required)
+            for name, input_type, input_default, input_required in _get_run_inputs(
+                self.run
             )
-
-        return inputs
+        }
 
     def outputs(self) -> Any:
         """
@@ -578,7 +786,7 @@ class Task(metaclass=SignatureValidator):
         Returns:
             - Any
         """
-        return_annotation = inspect.signature(self.run).return_annotation
+        return_annotation = _get_run_signature(self.run).return_annotation
         if return_annotation is inspect._empty:  # type: ignore
             return_annotation = Any
         return return_annotation
@@ -592,7 +800,7 @@ class Task(metaclass=SignatureValidator):
         Returns:
             - dict representing this task
         """
-        return prefect.serialization.task.TaskSchema().dump(self)
+        return get_dump_schema(prefect.serialization.task.TaskSchema).dump(self)
 
     # Operators  ----------------------------------------------------------------
 
@@ -1006,7 +1214,7 @@ class Parameter(Task):
         )
 
     def __repr__(self) -> str:
-        return "<Parameter: {self.name}>".format(self=self)
+        return "<Parameter: {}>".format(self.name)
 
     def __call__(self, flow: "Flow" = None) -> "Parameter":  # type: ignore
         """
@@ -1043,15 +1251,16 @@ class Parameter(Task):
         return super().copy(name=name, slug=name, **task_args)
 
     def run(self) -> Any:
-        params = prefect.context.get("parameters") or {}
-        if self.required and self.name not in params:
-            self.logger.debug(
-                'Parameter "{}" was required but not provided.'.format(self.name)
-            )
-            raise prefect.engine.signals.FAIL(
-                'Parameter "{}" was required but not provided.'.format(self.name)
-            )
-        return params.get(self.name, self.default)
+        params = prefect.context.get("parameters") or _NO_PARAMETERS
+        try:
+            return params[self.name]
+        except KeyError:
+            if not self.required:
+                return self.default
+
+        msg = 'Parameter "{}" was required but not provided.'.format(self.name)
+        self.logger.debug(msg)
+        raise prefect.engine.signals.FAIL(msg)
 
     # Serialization ------------------------------------------------------------
 
@@ -1062,4 +1271,4 @@ class Parameter(Task):
         Returns:
             - dict representing this parameter
         """
-        return prefect.serialization.task.ParameterSchema().dump(self)
+        return get_dump_schema(prefect.serialization.task.ParameterSchema).dump(self)
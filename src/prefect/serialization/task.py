@@ -34,6 +34,16 @@ class TaskMethodsMixin:
         else:
             return super().get_attribute(obj, key, default)  # type: ignore
 
+    def dump_type(self, task: prefect.core.Task) -> str:
+        """
+        Serializes the task's type. This is a method field rather than a function field
+        because marshmallow re-inspects the signature of function fields on every dump.
+        """
+        return to_qualified_name(type(task))
+
+    def load_type(self, value: str) -> str:
+        return value
+
     def load_inputs(self, task: prefect.core.Task) -> Dict[str, Dict]:
         if not isinstance(task, prefect.core.Task):
             return self.get_attribute(task, "inputs", None)
@@ -73,7 +83,7 @@ class TaskSchema(TaskMethodsMixin, ObjectSchema):
         object_class = lambda: prefect.core.Task
         exclude_fields = ["type", "inputs", "outputs"]
 
-    type = fields.Function(lambda task: to_qualified_name(type(task)), lambda x: x)
+    type = fields.Method("dump_type", "load_type")
     name = fields.String(allow_none=True)
     slug = fields.String(allow_none=True)
     description = fields.String(allow_none=True)
@@ -123,7 +133,7 @@ class ParameterSchema(TaskMethodsMixin, ObjectSchema):
         object_class = lambda: prefect.core.task.Parameter  # type: ignore
         exclude_fields = ["type", "outputs", "slug"]
 
-    type = fields.Function(lambda task: to_qualified_name(type(task)), lambda x: x)
+    type = fields.Method("dump_type", "load_type")
     name = fields.String(required=True)
     slug = fields.String(allow_none=True)
     default = JSONCompatible(allow_none=True)
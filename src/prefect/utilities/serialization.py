@@ -1,5 +1,6 @@
 import base64
 import datetime
+import functools
 import inspect
 import json
 import sys
@@ -70,6 +71,26 @@ def from_qualified_name(obj_str: str) -> Any:
     )
 
 
+@functools.lru_cache(maxsize=None)
+def get_dump_schema(schema_class: type) -> Schema:
+    """
+    Returns a shared instance of a schema class, for use when serializing objects.
+    Instantiating a Schema is several times more expensive than dumping a simple object
+    with it, so hot serialization paths should reuse one instance.
+
+    Only use this for `dump()`: loading stores state (like the cache of deserialized tasks)
+    in the schema's context. Schemas with a `Nested` field that uses a
+    `value_selection_fn` also write to the context while dumping, and should not be shared.
+
+    Args:
+        - schema_class (type): the Schema class
+
+    Returns:
+        - Schema: an instance of `schema_class`
+    """
+    return schema_class()
+
+
 class ObjectSchemaOptions(SchemaOpts):
     def __init__(self, meta: Any, **kwargs: Any) -> None:
         super().__init__(meta, **kwargs)
@@ -399,6 +420,11 @@ class StatefulFunctionReference(fields.Field):
         else:
             base_name = next(filter(None, valid_bases)) if valid_bases else qual_name
 
+        # functions that don't close over any variables have no state to store, so we
+        # avoid the comparatively expensive inspection of their globals and builtins
+        if getattr(value, "__closure__", False) is None:
+            return {"fn": base_name, "kwargs": {}}
+
         nonlocals = dict(inspect.getclosurevars(value).nonlocals)
 
         for k, v in list(nonlocals.items()):
@@ -39,7 +39,7 @@ def tags(*tags: str) -> Iterator[None]:
     ```
     """
     tags_set = set(tags)
-    tags_set.update(prefect.context.get("tags", set()))
+    tags_set.update(prefect.context.get("tags", ()))
     with prefect.context(tags=tags_set):
         yield
 
@@ -1,9 +1,11 @@
+import inspect
 import json
 import logging
 import uuid
 from datetime import timedelta
 from typing import Any, Union
 
+import cloudpickle
 import pytest
 
 import prefect
@@ -284,6 +286,24 @@ def test_tags_are_added_when_arguments_are_bound():
     assert t3.tags == {"math", "test"}
 
 
+def test_binding_default_run_method():
+    class NoRunTask(Task):
+        pass
+
+    with Flow(name="test") as f:
+        t1 = Task()(upstream_tasks=[1])
+        t2 = NoRunTask()()
+
+    assert f.tasks == {t1, t2, f.edges_to(t1).pop().upstream_task}
+    assert not any(e.key for e in f.edges)
+
+    with Flow(name="test"):
+        with pytest.raises(TypeError):
+            Task()(1)
+        with pytest.raises(TypeError):
+            NoRunTask()(x=1)
+
+
 def test_tags():
     t1 = Task()
     assert t1.tags == set()
@@ -303,6 +323,35 @@ def test_tags():
         assert t5.tags == set(["test1", "test2", "test3"])
 
 
+def test_tag_sets_are_shared():
+    with prefect.context(tags=["test"]):
+        t1, t2 = Task(), AddTask(tags=["test"])
+
+    assert isinstance(t1.tags, frozenset)
+    assert t1.tags is t2.tags
+    assert Task().tags is Task().tags
+
+
+def test_untagged_tasks_share_empty_tags():
+    t1, t2 = Task(), Task(tags=[])
+    with prefect.context(tags=[]):
+        t3 = AddTask(tags=set())
+
+    assert t1.tags == frozenset()
+    assert t1.tags is t2.tags is t3.tags
+
+
+def test_binding_tags_does_not_change_other_tasks():
+    t1, t2 = AddTask(tags=["math"]), AddTask(tags=["math"])
+
+    with prefect.context(tags=["test"]):
+        with Flow(name="test"):
+            t1.bind(1, 2)
+
+    assert t1.tags == {"math", "test"}
+    assert t2.tags == {"math"}
+
+
 class TestInputsOutputs:
     class add(Task):
         def run(self, x, y: int = 1) -> int:
@@ -325,6 +374,13 @@ class TestInputsOutputs:
                 y=dict(type=int, required=False, default=1),
             )
 
+    def test_inputs_are_new_dicts_for_each_call(self):
+        t = self.add()
+        inputs = t.inputs()
+        inputs["x"]["required"] = False
+        assert t.inputs()["x"]["required"] is True
+        assert self.add().inputs()["x"]["required"] is True
+
     def test_outputs(self):
         assert self.add().outputs() == int
 
@@ -332,6 +388,74 @@ class TestInputsOutputs:
         with Flow("test"):
             assert self.mult(x=1).outputs() == int
 
+    def test_run_signature_is_cached_per_function(self):
+        t1, t2 = self.add(), self.add()
+        sig = prefect.core.task._get_run_signature(t1.run)
+        assert prefect.core.task._get_run_signature(t2.run) is sig
+        assert list(sig.parameters) == ["x", "y"]
+
+    def test_run_signature_distinguishes_functions_and_methods(self):
+        method_sig = prefect.core.task._get_run_signature(self.add().run)
+        func_sig = prefect.core.task._get_run_signature(self.add.run)
+        assert list(method_sig.parameters) == ["x", "y"]
+        assert list(func_sig.parameters) == ["self", "x", "y"]
+
+    def test_run_var_keyword(self):
+        class KwargsTask(Task):
+            def run(self, x, **params):
+                pass
+
+        get_var_keyword = prefect.core.task._get_run_var_keyword
+        assert get_var_keyword(KwargsTask().run) == "params"
+        assert get_var_keyword(self.add().run) is None
+
+
+class TestRunBinder:
+    def bind(self, fn, *args, **kwargs):
+        return prefect.core.task._get_run_binder(fn)(*args, **kwargs)
+
+    def test_binder_only_includes_provided_arguments(self):
+        def run(x, y=1, *, z=None):
+            pass
+
+        assert self.bind(run, 1) == dict(x=1)
+        assert self.bind(run, 1, 2) == dict(x=1, y=2)
+        assert self.bind(run, y=2, x=1, z=None) == dict(x=1, y=2, z=None)
+
+    def test_binder_expands_var_kwargs(self):
+        def run(x, **kwargs):
+            pass
+
+        assert self.bind(run, 1, a=2, b=3) == dict(x=1, a=2, b=3)
+
+    def test_binder_handles_argument_names_used_by_binder(self):
+        def run(_missing, _callargs=None, **_missing_):
+            pass
+
+        assert self.bind(run, 1, 2, a=3) == dict(_missing=1, _callargs=2, a=3)
+
+    def test_binder_for_methods_skips_self(self):
+        assert self.bind(AddTask().run, 1) == dict(x=1)
+        assert self.bind(AddTask.run, None, 1) == dict(self=None, x=1)
+
+    @pytest.mark.parametrize(
+        "args,kwargs", [((), {}), ((1, 2, 3), {}), ((1,), dict(x=1)), ((1,), dict(z=1))]
+    )
+    def test_binder_raises_like_signature_bind(self, args, kwargs):
+        def run(x, y=1):
+            pass
+
+        with pytest.raises(TypeError):
+            inspect.signature(run).bind(*args, **kwargs)
+        with pytest.raises(TypeError):
+            self.bind(run, *args, **kwargs)
+
+    def test_binder_falls_back_to_signature_bind(self):
+        # builtins can have positional-only arguments, which compiled binders don't support
+        assert self.bind(divmod, 1, 2) == dict(
+            inspect.signature(divmod).bind(1, 2).arguments
+        )
+
 
 class TestTaskCopy:
     def test_copy_copies(self):
@@ -386,6 +510,32 @@ class TestTaskCopy:
         assert t.slug == "test"
         assert t2.slug == "test-2"
 
+    def test_copy_preserves_instance_attributes(self):
+        t = Parameter("x", default=1, tags=["a"])
+        t.extra = "extra"
+        t2 = t.copy("y")
+        assert (t2.name, t2.default, t2.tags, t2.extra) == ("y", 1, {"a"}, "extra")
+
+
+def test_task_repr():
+    assert repr(Task(name="x")) == "<Task: x>"
+    assert repr(AddTask()) == "<Task: AddTask>"
+    assert repr(Parameter("p")) == "<Parameter: p>"
+
+
+def test_task_subclass_defined_in_main_can_be_cloudpickled():
+    # classes defined in __main__ (e.g. in a flow script) are pickled by value
+    class MainTask(Task):
+        __module__ = "__main__"
+
+        def run(self, x):
+            return x + 1
+
+    t = cloudpickle.loads(cloudpickle.dumps(MainTask(name="x", tags=["a"])))
+    assert type(t).__name__ == "MainTask"
+    assert (t.name, t.tags) == ("x", {"a"})
+    assert t.run(1) == 2
+
 
 def test_task_has_slug():
     t1 = Task()
@@ -394,6 +544,30 @@ def test_task_has_slug():
     assert t1.slug and t1.slug != t2.slug
 
 
+class TestParameterRun:
+    def test_parameter_returns_value_from_context(self):
+        p = Parameter("x", default=1)
+        with prefect.context(parameters=dict(x=2)):
+            assert p.run() == 2
+
+    def test_parameter_returns_falsey_value_from_context(self):
+        p = Parameter("x", default=1)
+        with prefect.context(parameters=dict(x=None)):
+            assert p.run() is None
+
+    def test_parameter_returns_default_if_not_provided(self):
+        p = Parameter("x", default=1)
+        assert p.run() == 1
+        with prefect.context(parameters=dict(y=2)):
+            assert p.run() == 1
+
+    def test_required_parameter_fails_if_not_provided(self):
+        p = Parameter("x")
+        with prefect.context(parameters=dict(y=2)):
+            with pytest.raises(prefect.engine.signals.FAIL, match="required"):
+                p.run()
+
+
 class TestDependencies:
     def test_set_downstream(self):
         f = Flow(name="test")
@@ -12,9 +12,29 @@ from prefect.schedules import schedules, clocks, filters, adjustments
 from prefect.serialization.schedule import ScheduleSchema
 
 
+SCHEDULE_SCHEMA = ScheduleSchema()
+
+
 def serialize_and_deserialize(schedule: schedules.Schedule):
-    schema = ScheduleSchema()
-    return schema.load(json.loads(json.dumps(schema.dump(schedule))))
+    return SCHEDULE_SCHEMA.load(SCHEDULE_SCHEMA.dump(schedule))
+
+
+def test_serialized_schedule_is_json_compatible():
+    dt = pendulum.datetime(2019, 1, 1)
+    s = schedules.Schedule(
+        clocks=[
+            clocks.IntervalClock(timedelta(days=1)),
+            clocks.CronClock("0 12 * * *"),
+        ],
+        filters=[filters.is_weekday],
+        not_filters=[filters.between_dates(1, 2, 1, 2)],
+        adjustments=[adjustments.add(timedelta(hours=1))],
+    )
+    serialized = SCHEDULE_SCHEMA.dump(s)
+    assert json.loads(json.dumps(serialized)) == serialized
+
+    s2 = SCHEDULE_SCHEMA.load(json.loads(json.dumps(serialized)))
+    assert s2.next(5, after=dt) == s.next(5, after=dt)
 
 
 def test_serialize_complex_schedule():
@@ -103,6 +103,7 @@ def test_serialize_parameter():
     ps = ParameterSchema().dump(p)
     assert ps["default"] == None
     assert ps["required"] is True
+    assert ps["type"] == "prefect.core.task.Parameter"
 
 
 def test_deserialize_parameter():
@@ -102,7 +102,7 @@ class TestConfig:
         assert config.update == 1
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_config_file_path():
     with tempfile.NamedTemporaryFile() as test_config:
         test_config.write(template)
@@ -194,6 +194,33 @@ def test_string_to_type_function():
     assert configuration.string_to_type("x") == "x"
 
 
+@pytest.mark.parametrize(
+    "val",
+    [
+        "",
+        " 1",
+        "1 ",
+        "01",
+        "-0",
+        "+1",
+        "1.",
+        ".5",
+        "1.50",
+        "1e3",
+        "1_000",
+        "true ",
+        pytest.param("1" * 5000, id="5000-digits"),
+    ],
+)
+def test_string_to_type_leaves_non_canonical_numbers_as_strings(val):
+    assert configuration.string_to_type(val) == val
+
+
+def test_string_to_type_function_with_float_exponents():
+    assert configuration.string_to_type("1e+16") == 1e16
+    assert configuration.string_to_type("-1.5e-07") == -1.5e-07
+
+
 def test_env_var_interpolation_with_type_assignment(config):
     assert config.env_vars.true is True
     assert config.env_vars.false is False
@@ -378,14 +405,13 @@ class TestConfigValidation:
             with pytest.raises(ValueError):
                 configuration.load_configuration(test_config.name)
 
-    def test_invalid_env_var_raises_error(self, monkeypatch):
+    def test_invalid_env_var_raises_error(self, test_config_file_path, monkeypatch):
         monkeypatch.setenv("PREFECT_TEST__X__Y__KEYS__Z", "TEST")
 
-        with tempfile.NamedTemporaryFile() as test_config:
-            with pytest.raises(ValueError):
-                configuration.load_configuration(
-                    test_config.name, env_var_prefix="PREFECT_TEST"
-                )
+        with pytest.raises(ValueError):
+            configuration.load_configuration(
+                test_config_file_path, env_var_prefix="PREFECT_TEST"
+            )
 
     def test_mixed_case_keys_are_ok(self):
         with tempfile.NamedTemporaryFile() as test_config:
@@ -1,4 +1,5 @@
 import datetime
+import inspect
 import itertools
 import uuid
 
@@ -19,6 +20,7 @@ from prefect.utilities.serialization import (
     ObjectSchema,
     OneOfSchema,
     StatefulFunctionReference,
+    get_dump_schema,
 )
 
 json_test_values = [
@@ -235,6 +237,17 @@ class TestStatefulFunctionReferenceField:
         assert serialized["f"]["fn"] == "tests.utilities.test_serialization.outer"
         assert not serialized["f"]["kwargs"]
 
+    def test_serialize_outer_no_state_skips_closure_inspection(self, monkeypatch):
+        def getclosurevars(fn):
+            raise AssertionError("closure should not be inspected")
+
+        monkeypatch.setattr(inspect, "getclosurevars", getclosurevars)
+        serialized = self.Schema().dump(dict(f=outer))
+        assert serialized["f"] == {
+            "fn": "tests.utilities.test_serialization.outer",
+            "kwargs": {},
+        }
+
     def test_serialize_outer_with_state(self):
         """Have to account for order because of Python 3.5"""
         serialized = self.Schema().dump(dict(f=outer(x=1, y=2, z=99)))
@@ -392,6 +405,13 @@ class TestObjectSchema:
         assert not hasattr(deserialized, "y")
 
 
+def test_get_dump_schema_reuses_instances():
+    schema = get_dump_schema(Child)
+    assert isinstance(schema, Child)
+    assert get_dump_schema(Child) is schema
+    assert schema.dump(dict(x="1")) == dict(x="1")
+
+
 class TestOneOfSchema:
     def test_oneofschema_load_dotdict(self):
         """